@@ -1,5 +1,6 @@
 const { app, BrowserWindow, ipcMain, shell } = require('electron');
 const path = require('path');
+const os = require('os');
 const sudo = require('sudo-prompt');
 const fs = require('fs');
 const https = require('https');
@@ -120,7 +121,6 @@ ipcMain.handle('get-current-version', async () => {
 ipcMain.handle('download-update', async (event, { url, fileName, onProgress }) => {
   return new Promise((resolve) => {
     try {
-      const os = require('os');
       const downloadsDir = path.join(os.homedir(), 'Downloads');
       
       // Create downloads directory if it doesn't exist (though it usually does)
@@ -275,7 +275,6 @@ ipcMain.handle('open-external-link', async (event, url) => {
 
 ipcMain.handle('open-downloads-folder', async () => {
   try {
-    const os = require('os');
     const downloadsPath = path.join(os.homedir(), 'Downloads');
     await shell.openPath(downloadsPath);
     return { success: true };
@@ -190,12 +190,20 @@ function requestDeviceUidDirect(callback) {
     return;
   }
   
+  // Serve from cache when this device's UID was already read - the UID is
+  // immutable silicon data, so one READUID round-trip per connection is enough
+  const activeDeviceForUid = window.multiDeviceManager?.getActiveDevice?.();
+  if (activeDeviceForUid?.uid) {
+    console.log('[requestDeviceUidDirect] Using cached UID:', activeDeviceForUid.uid);
+    return callback(activeDeviceForUid.uid);
+  }
+
   // Prevent multiple simultaneous requests
   if (requestDeviceUidDirect.inProgress) {
     console.warn('[requestDeviceUidDirect] Request already in progress, skipping duplicate');
     return callback(null);
   }
-  
+
   requestDeviceUidDirect.inProgress = true;
   
   console.log('[requestDeviceUidDirect] Requesting UID via READUID command');
@@ -230,6 +238,10 @@ function requestDeviceUidDirect(callback) {
         // Check if it's a 16-character hex string (the UID)
         if (/^[0-9A-Fa-f]{16}$/.test(trimmed)) {
           console.log('[requestDeviceUidDirect] Found valid UID:', trimmed);
+          // Cache on the device object so later requests skip the round-trip
+          if (activeDeviceForUid) {
+            activeDeviceForUid.uid = trimmed;
+          }
           callback(trimmed);
           return;
         }
@@ -693,6 +705,25 @@ function initializeDeviceSelector() {
 }
 const { SerialPort } = require('serialport');
 
+// Diagnostics input layout (matching firmware READPIN keys), resolved once
+// here - the status handler runs for every polled PIN: message, so the
+// name/key tables should not be rebuilt per call
+const DIAG_BUTTON_INPUTS_ROW1 = [
+  { name: 'Green', key: 'GREEN_FRET' },
+  { name: 'Red', key: 'RED_FRET' },
+  { name: 'Yellow', key: 'YELLOW_FRET' },
+  { name: 'Blue', key: 'BLUE_FRET' },
+  { name: 'Orange', key: 'ORANGE_FRET' }
+];
+const DIAG_BUTTON_INPUTS_ROW2 = [
+  { name: 'Strum Up', key: 'STRUM_UP' },
+  { name: 'Strum Down', key: 'STRUM_DOWN' },
+  { name: 'Start', key: 'START' },
+  { name: 'Select', key: 'SELECT' },
+  { name: 'Tilt', key: 'TILT' }
+];
+const DIAG_BUTTON_INPUTS = [...DIAG_BUTTON_INPUTS_ROW1, ...DIAG_BUTTON_INPUTS_ROW2];
+
 // Configure SerialPort to allow more event listeners to prevent memory leak warnings
 // This is necessary because we may have multiple async requests running simultaneously
 SerialPort.prototype.setMaxListeners(20);
@@ -764,6 +795,7 @@ const path = require('path');
 // ===== MODULAR MULTI-DEVICE SUPPORT =====
 const MultiDeviceManager = require('./multiDeviceManager');
 const serialFileIO = require('./serialFileIO');
+const configUtils = require('./configUtils.js');
 
 // Global multi-device manager instance
 const multiDeviceManager = new MultiDeviceManager();
@@ -1395,16 +1427,28 @@ function rgbToHex(rgbString) {
   return "#" + [r, g, b].map(n => n.toString(16).padStart(2, '0')).join('');
 }
 
+// Parsed-color cache: config applies re-derive the same few palette colors
+// for every LED, so memoize hex -> [r, g, b]. Returned tuples are shared -
+// treat them as read-only. Cleared if a long picker session floods it with
+// one-off values.
+const hexRgbCache = new Map();
+
 function hexToRgb(hex) {
+  let rgb = hexRgbCache.get(hex);
+  if (rgb) return rgb;
+
   // Remove # if present
-  hex = hex.replace('#', '');
-  
+  const cleaned = hex.replace('#', '');
+
   // Parse hex to RGB values
-  const r = parseInt(hex.substr(0, 2), 16);
-  const g = parseInt(hex.substr(2, 2), 16);
-  const b = parseInt(hex.substr(4, 2), 16);
-  
-  return [r, g, b];
+  const r = parseInt(cleaned.substr(0, 2), 16);
+  const g = parseInt(cleaned.substr(2, 2), 16);
+  const b = parseInt(cleaned.substr(4, 2), 16);
+
+  rgb = [r, g, b];
+  if (hexRgbCache.size > 512) hexRgbCache.clear();
+  hexRgbCache.set(hex, rgb);
+  return rgb;
 }
 
 function sanitizeColor(color) {
@@ -3043,7 +3087,6 @@ document.addEventListener('DOMContentLoaded', () => {
         return;
       }
       // Only update color arrays, never overwrite the rest of the config
-      const configUtils = require('./configUtils.js');
       // Deep copy to avoid accidental mutation
       const safeConfig = JSON.parse(JSON.stringify(originalConfig));
       configUtils.applyPresetToConfig(safeConfig, presetHex);
@@ -3171,9 +3214,14 @@ document.addEventListener('DOMContentLoaded', () => {
         connectedPort.write("IMPORTUSER\n");
         connectedPort.write(payload + "\n");
         connectedPort.write("END\n");
-        awaitingFile = 'user_presets.json';
-        responseBuffers[awaitingFile] = '';
-        connectedPort.write("READFILE:user_presets.json\n");
+        // Keep the in-memory copy authoritative instead of re-reading
+        // user_presets.json back from the device - the device just merged
+        // exactly the slot we sent, so the round-trip only cost time
+        if (typeof window.loadedUserPresets !== 'object' || window.loadedUserPresets === null) {
+          window.loadedUserPresets = {};
+        }
+        window.loadedUserPresets[slot] = data;
+        populatePresetDropdown(window.loadedUserPresets, true);
       }
       isDirty = false;
       document.getElementById('save-custom-btn').style.display = 'none';
@@ -3442,7 +3490,6 @@ document.getElementById('apply-config-btn')?.addEventListener('click', () => {
   }
 
   // Modular: Use configUtils to update color arrays in config
-  const configUtils = require('./configUtils.js');
   // Collect current UI colors into a preset-like object
   // Use the unified collectCurrentColors (always converts rgb to hex)
   const currentColors = collectCurrentColors();
@@ -3591,10 +3638,12 @@ document.getElementById('apply-config-btn')?.addEventListener('click', () => {
                   // Store presets globally to access version info
                   window.loadedPresets = parsed;
                   // Always dispatch deviceFilesLoaded event with both presets and userPresets (never undefined)
+                  // Pass the parsed objects directly - listeners accept objects,
+                  // and stringifying here just forced them to re-parse
                   const event = new CustomEvent('deviceFilesLoaded', {
                     detail: {
-                      presets: JSON.stringify(parsed),
-                      userPresets: window.loadedUserPresets ? JSON.stringify(window.loadedUserPresets) : JSON.stringify({})
+                      presets: parsed,
+                      userPresets: window.loadedUserPresets || {}
                     }
                   });
                   window.dispatchEvent(event);
@@ -3607,10 +3656,11 @@ document.getElementById('apply-config-btn')?.addEventListener('click', () => {
                   }
                 } else if (awaitingFile === 'user_presets.json') {
                   // Always dispatch deviceFilesLoaded event with both userPresets and presets (never undefined)
+                  // Parsed objects are passed as-is so listeners don't re-parse
                   const event = new CustomEvent('deviceFilesLoaded', {
                     detail: {
-                      userPresets: JSON.stringify(parsed),
-                      presets: window.loadedPresets ? JSON.stringify(window.loadedPresets) : JSON.stringify({})
+                      userPresets: parsed,
+                      presets: window.loadedPresets || {}
                     }
                   });
                   window.dispatchEvent(event);
@@ -5000,25 +5050,10 @@ if (window.multiDeviceManager) {
     diagInputBoxesRow1.innerHTML = '';
     diagInputBoxesRow2.innerHTML = '';
     
-    // Define button layouts (matching the ones used in polling system)
-    const buttonInputsRow1 = [
-      { name: 'Green', key: 'GREEN_FRET' },
-      { name: 'Red', key: 'RED_FRET' },
-      { name: 'Yellow', key: 'YELLOW_FRET' },
-      { name: 'Blue', key: 'BLUE_FRET' },
-      { name: 'Orange', key: 'ORANGE_FRET' }
-    ];
-    
-    const buttonInputsRow2 = [
-      { name: 'Strum Up', key: 'STRUM_UP' },
-      { name: 'Strum Down', key: 'STRUM_DOWN' },
-      { name: 'Start', key: 'START' },
-      { name: 'Select', key: 'SELECT' },
-      { name: 'Tilt', key: 'TILT' }
-    ];
-    
+    // Button layouts come from the shared module-level tables
+    // (matching the ones used in the polling system)
     // Create button status boxes for row 1
-    buttonInputsRow1.forEach(button => {
+    DIAG_BUTTON_INPUTS_ROW1.forEach(button => {
       const box = document.createElement('div');
       box.className = 'diag-input-box';
       box.setAttribute('data-key', button.key);
@@ -5043,7 +5078,7 @@ if (window.multiDeviceManager) {
     });
     
     // Create button status boxes for row 2
-    buttonInputsRow2.forEach(button => {
+    DIAG_BUTTON_INPUTS_ROW2.forEach(button => {
       const box = document.createElement('div');
       box.className = 'diag-input-box';
       box.setAttribute('data-key', button.key);
@@ -5067,7 +5102,7 @@ if (window.multiDeviceManager) {
       diagInputBoxesRow2.appendChild(box);
     });
     
-    console.log('✅ Input status table created with', buttonInputsRow1.length + buttonInputsRow2.length, 'buttons');
+    console.log('✅ Input status table created with', DIAG_BUTTON_INPUTS.length, 'buttons');
   }
 
   // Function to update input status display for diagnostic page
@@ -5429,15 +5464,27 @@ if (window.multiDeviceManager) {
       { r: 0, g: 0, b: 0 }    // Black
     ];
     
+    // SETLED batches are constant per color, so build the 7 command lines
+    // once per color and reuse them - the test loop then does one serial
+    // write per tick instead of formatting and writing LED-by-LED
+    const ledTestBatchCache = new Map();
+
     function sendLedTestColor(color) {
       // Send color to all 7 LEDs using SETLED command with proper indexing
       // LED indices: 0=strum-up, 1=strum-down, 2=orange, 3=blue, 4=yellow, 5=red, 6=green
       const { r, g, b } = color;
-      
-      for (let ledIndex = 0; ledIndex < 7; ledIndex++) {
-        if (connectedPort) {
-          connectedPort.write(`SETLED:${ledIndex}:${r}:${g}:${b}\n`);
+      const key = `${r}:${g}:${b}`;
+      let batch = ledTestBatchCache.get(key);
+      if (!batch) {
+        batch = '';
+        for (let ledIndex = 0; ledIndex < 7; ledIndex++) {
+          batch += `SETLED:${ledIndex}:${r}:${g}:${b}\n`;
         }
+        ledTestBatchCache.set(key, batch);
+      }
+
+      if (connectedPort) {
+        connectedPort.write(batch);
       }
     }
     
@@ -5769,22 +5816,7 @@ if (window.multiDeviceManager) {
       if (!connectedPort || !checkbox || !checkbox.checked) return;
       stopDiagPinStatusPolling();
       
-      const buttonInputsRow1 = [
-        { name: 'Green', key: 'GREEN_FRET' },
-        { name: 'Red', key: 'RED_FRET' },
-        { name: 'Yellow', key: 'YELLOW_FRET' },
-        { name: 'Blue', key: 'BLUE_FRET' },
-        { name: 'Orange', key: 'ORANGE_FRET' }
-      ];
-      const buttonInputsRow2 = [
-        { name: 'Strum Up', key: 'STRUM_UP' },
-        { name: 'Strum Down', key: 'STRUM_DOWN' },
-        { name: 'Start', key: 'START' },
-        { name: 'Select', key: 'SELECT' },
-        { name: 'Tilt', key: 'TILT' }
-      ];
-      
-      const keys = [...buttonInputsRow1, ...buttonInputsRow2].map(b => b.key);
+      const keys = DIAG_BUTTON_INPUTS.map(b => b.key);
       let currentKeyIndex = 0;
       
       // Round-robin polling: poll one button at a time to prevent serial buffer overflow
@@ -6123,7 +6155,7 @@ if (window.multiDeviceManager) {
       }
       
       // Also hide popover for PREVIEWLED confirmations (LED test commands)
-      if (str.includes('PREVIEWLED applied') || str.includes('PREVIEWLED')) {
+      if (str.includes('PREVIEWLED')) {
         if (bufferClearingActive) {
           hideBufferClearingPopover();
         }
@@ -6134,22 +6166,7 @@ if (window.multiDeviceManager) {
   }
   
   function updateDiagInputBoxes() {
-    const buttonInputsRow1 = [
-      { name: 'Green', key: 'GREEN_FRET' },
-      { name: 'Red', key: 'RED_FRET' },
-      { name: 'Yellow', key: 'YELLOW_FRET' },
-      { name: 'Blue', key: 'BLUE_FRET' },
-      { name: 'Orange', key: 'ORANGE_FRET' }
-    ];
-    const buttonInputsRow2 = [
-      { name: 'Strum Up', key: 'STRUM_UP' },
-      { name: 'Strum Down', key: 'STRUM_DOWN' },
-      { name: 'Start', key: 'START' },
-      { name: 'Select', key: 'SELECT' },
-      { name: 'Tilt', key: 'TILT' }
-    ];
-    
-    [...buttonInputsRow1, ...buttonInputsRow2].forEach(input => {
+    DIAG_BUTTON_INPUTS.forEach(input => {
       const key = input.key;
       const status = diagPinStatusMap[key];
       const box = document.querySelector(`.diag-input-box[data-key='${key}']`);
@@ -6385,6 +6402,15 @@ let ledTestColors = [
   [75, 0, 130],   // Indigo
   [238, 130, 238] // Violet
 ];
+// Precomputed SETLED batches for the test cycle - the 7 command lines per
+// color never change, so each color becomes a single ready-made write
+const ledTestCommandBatches = ledTestColors.map(([r, g, b]) => {
+  let batch = '';
+  for (let i = 0; i < 7; i++) {
+    batch += `SETLED:${i}:${r}:${g}:${b}\n`;
+  }
+  return batch;
+});
 let ledTestStep = 0;
 
 function startLedTest() {
@@ -6400,18 +6426,16 @@ function startLedTest() {
       return;
     }
     
-    // Set all LEDs to current color
-    const color = ledTestColors[ledTestStep % ledTestColors.length];
-    for (let i = 0; i < 7; i++) {
-      try {
-        connectedPort.write(`SETLED:${i}:${color[0]}:${color[1]}:${color[2]}\n`);
-      } catch (err) {
-        console.error('LED test write error:', err);
-        stopLedTest();
-        return;
-      }
+    // Set all LEDs to current color with a single precomputed write
+    const batch = ledTestCommandBatches[ledTestStep % ledTestCommandBatches.length];
+    try {
+      connectedPort.write(batch);
+    } catch (err) {
+      console.error('LED test write error:', err);
+      stopLedTest();
+      return;
     }
-    
+
     ledTestStep++;
   }, 500); // Change color every 500ms
 }
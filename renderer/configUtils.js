@@ -1,6 +1,29 @@
 // configUtils.js
 // Utility functions for config merging, validation, and safe updates
 
+// Default mapping for BGG: led_color and released_color arrays, resolved
+// once here (index i in each array maps to the same LED slot)
+// led_color: [strum-up-active, strum-down-active, orange-fret-pressed, blue-fret-pressed, yellow-fret-pressed, red-fret-pressed, green-fret-pressed]
+// released_color: [strum-up-released, strum-down-released, orange-fret-released, blue-fret-released, yellow-fret-released, red-fret-released, green-fret-released]
+const ledPressedKeys = [
+  'strum-up-active',
+  'strum-down-active',
+  'orange-fret-pressed',
+  'blue-fret-pressed',
+  'yellow-fret-pressed',
+  'red-fret-pressed',
+  'green-fret-pressed'
+];
+const ledReleasedKeys = [
+  'strum-up-released',
+  'strum-down-released',
+  'orange-fret-released',
+  'blue-fret-released',
+  'yellow-fret-released',
+  'red-fret-released',
+  'green-fret-released'
+];
+
 /**
  * Merge color arrays from a preset into a full config object, preserving all other fields.
  * @param {object} config - The full config object to update (mutated in place).
@@ -14,27 +37,6 @@ function applyPresetToConfig(config, preset, options = {}) {
   if (!Array.isArray(config.led_color)) config.led_color = Array(7).fill('#ffffff');
   if (!Array.isArray(config.released_color)) config.released_color = Array(7).fill('#ffffff');
 
-  // Default mapping for BGG: led_color and released_color arrays
-  // led_color: [strum-up-active, strum-down-active, orange-fret-pressed, blue-fret-pressed, yellow-fret-pressed, red-fret-pressed, green-fret-pressed]
-  // released_color: [strum-up-released, strum-down-released, orange-fret-released, blue-fret-released, yellow-fret-released, red-fret-released, green-fret-released]
-  const ledPressedKeys = [
-    'strum-up-active',
-    'strum-down-active',
-    'orange-fret-pressed',
-    'blue-fret-pressed',
-    'yellow-fret-pressed',
-    'red-fret-pressed',
-    'green-fret-pressed'
-  ];
-  const ledReleasedKeys = [
-    'strum-up-released',
-    'strum-down-released',
-    'orange-fret-released',
-    'blue-fret-released',
-    'yellow-fret-released',
-    'red-fret-released',
-    'green-fret-released'
-  ];
   for (let i = 0; i < 7; i++) {
     if (preset[ledPressedKeys[i]]) config.led_color[i] = preset[ledPressedKeys[i]];
     if (preset[ledReleasedKeys[i]]) config.released_color[i] = preset[ledReleasedKeys[i]];
@@ -2,6 +2,17 @@
 console.log('[deviceUI.js] Loaded. Assigning applyConfig and populatePresetDropdown to window.');
 // Handles UI updates for device config, presets, and user presets
 
+// Preset key order matching the config led_color/released_color arrays,
+// resolved once instead of per dropdown change
+const LED_ORDER = [
+  'strum-up-active', 'strum-down-active',
+  'orange-fret-pressed', 'blue-fret-pressed', 'yellow-fret-pressed', 'red-fret-pressed', 'green-fret-pressed'
+];
+const RELEASED_ORDER = [
+  'strum-up-released', 'strum-down-released',
+  'orange-fret-released', 'blue-fret-released', 'yellow-fret-released', 'red-fret-released', 'green-fret-released'
+];
+
 function applyConfig(config) {
   // Update fret buttons (pressed/released)
   const fretColors = {
@@ -291,16 +302,8 @@ if (window.multiDeviceManager && typeof window.multiDeviceManager.on === 'functi
     if (presetData && typeof presetData === 'object') {
       // Only update color arrays in window.originalConfig, never overwrite the full object
       if (window.originalConfig && typeof window.originalConfig === 'object') {
-        const ledOrder = [
-          'strum-up-active', 'strum-down-active',
-          'orange-fret-pressed', 'blue-fret-pressed', 'yellow-fret-pressed', 'red-fret-pressed', 'green-fret-pressed'
-        ];
-        const releasedOrder = [
-          'strum-up-released', 'strum-down-released',
-          'orange-fret-released', 'blue-fret-released', 'yellow-fret-released', 'red-fret-released', 'green-fret-released'
-        ];
-        const led_color = ledOrder.map(k => presetData[k] || '#FFFFFF');
-        const released_color = releasedOrder.map(k => presetData[k] || '#454545');
+        const led_color = LED_ORDER.map(k => presetData[k] || '#FFFFFF');
+        const released_color = RELEASED_ORDER.map(k => presetData[k] || '#454545');
         window.originalConfig.led_color = led_color;
         window.originalConfig.released_color = released_color;
         console.log('[deviceUI][DEBUG] Updated window.originalConfig color arrays from preset:', { led_color, released_color });
@@ -5,6 +5,27 @@ const { readFile, writeFile } = require('./serialFileIO');
 // Flag to control automatic file reading (set to true to enable automatic loading)
 const ENABLE_AUTOMATIC_FILE_READING = true;
 
+// PREVIEWLED colors always go to the device as HEX with a leading '#'.
+// Normalization runs once per LED per picker event (the live preview hot
+// path), so the rgb() pattern and helper are built once here instead of
+// being recreated inline at every call site.
+const RGB_COLOR_PATTERN = /rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)/;
+
+function toPreviewHexColor(color) {
+  if (typeof color !== 'string') return color;
+  if (color.startsWith('rgb')) {
+    const rgbMatch = color.match(RGB_COLOR_PATTERN);
+    if (rgbMatch) {
+      const r = parseInt(rgbMatch[1]);
+      const g = parseInt(rgbMatch[2]);
+      const b = parseInt(rgbMatch[3]);
+      return '#' + [r, g, b].map(x => x.toString(16).padStart(2, '0')).join('');
+    }
+    return color;
+  }
+  return color.startsWith('#') ? color : '#' + color;
+}
+
 // Shared state references (to be injected from app.js)
 let connectedPort = null;
 let awaitingFile = null;
@@ -161,21 +182,8 @@ class MultiDeviceManager {
     if (releasedKeys.length > 0) {
       for (const key of releasedKeys) {
         const baseLabel = this.getReleasedLedName(key);
-        let color = presetObj[key];
         // Always send HEX with leading #
-        if (typeof color === 'string') {
-          if (color.startsWith('rgb')) {
-            const rgbMatch = color.match(/rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)/);
-            if (rgbMatch) {
-              const r = parseInt(rgbMatch[1]);
-              const g = parseInt(rgbMatch[2]);
-              const b = parseInt(rgbMatch[3]);
-              color = '#' + [r, g, b].map(x => x.toString(16).padStart(2, '0')).join('');
-            }
-          } else if (!color.startsWith('#')) {
-            color = '#' + color;
-          }
-        }
+        const color = toPreviewHexColor(presetObj[key]);
         console.log(`[MultiDeviceManager] Previewing released color: label=${baseLabel}, color=${color}`);
         this.previewLed(baseLabel, color);
       }
@@ -184,20 +192,7 @@ class MultiDeviceManager {
       console.warn('[MultiDeviceManager] No -released keys found in preset. Previewing all keys as fallback.');
       for (const key of Object.keys(presetObj)) {
         const baseLabel = this.getReleasedLedName(key);
-        let color = presetObj[key];
-        if (typeof color === 'string') {
-          if (color.startsWith('rgb')) {
-            const rgbMatch = color.match(/rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)/);
-            if (rgbMatch) {
-              const r = parseInt(rgbMatch[1]);
-              const g = parseInt(rgbMatch[2]);
-              const b = parseInt(rgbMatch[3]);
-              color = '#' + [r, g, b].map(x => x.toString(16).padStart(2, '0')).join('');
-            }
-          } else if (!color.startsWith('#')) {
-            color = '#' + color;
-          }
-        }
+        const color = toPreviewHexColor(presetObj[key]);
         console.log(`[MultiDeviceManager] Fallback preview: label=${baseLabel}, color=${color}`);
         this.previewLed(baseLabel, color);
       }
@@ -218,22 +213,8 @@ class MultiDeviceManager {
     console.debug('[MultiDeviceManager][DEBUG] connectedDevices:', Array.from(this.connectedDevices.keys()));
     
     let ledName = this.getReleasedLedName(buttonOrIndex);
-    // Always send HEX with leading #
-    let color = colorValue;
-    if (typeof color === 'string') {
-      // Convert rgb() to HEX if needed
-      if (color.startsWith('rgb')) {
-        const rgbMatch = color.match(/rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)/);
-        if (rgbMatch) {
-          const r = parseInt(rgbMatch[1]);
-          const g = parseInt(rgbMatch[2]);
-          const b = parseInt(rgbMatch[3]);
-          color = '#' + [r, g, b].map(x => x.toString(16).padStart(2, '0')).join('');
-        }
-      } else if (!color.startsWith('#')) {
-        color = '#' + color;
-      }
-    }
+    // Always send HEX with leading # (converts rgb() if needed)
+    const color = toPreviewHexColor(colorValue);
     const device = this.getActiveDevice();
     
     // Enhanced debugging for device connection state
@@ -8,10 +8,37 @@
 // ✅ Large file handling: Dynamic timeouts and optimized transmission
 // ✅ BOOTSEL interference prevention: Integrated with multiDeviceManager
 
+// Gate for per-chunk/per-line tracing. The hot-path logs below stringify
+// every serial chunk (and for reads, the whole file content), which costs
+// more than the transfer itself on larger files - keep this off in releases
+// and flip it on only when debugging the serial protocol.
+const SERIAL_DEBUG = false;
+
 const DEFAULT_TIMEOUT = 30000; // Enhanced default timeout (30s) - Increased timeout for file operations
 const TIMEOUT_PER_KB = 8000; // Additional 8 seconds per KB for large files (enhanced from 5s)
 const LARGE_FILE_BONUS = 60000; // Extra 60 seconds for files larger than 10KB
 
+// Marker regexes depend only on the filename, and the app reads the same
+// handful of files (config.json, presets.json, user_presets.json, boot.py)
+// over and over - cache the compiled patterns instead of rebuilding them on
+// every read
+const markerRegexCache = new Map();
+
+function getMarkerRegexes(filename) {
+  let entry = markerRegexCache.get(filename);
+  if (!entry) {
+    const escaped = filename.replace('.', '\\.');
+    entry = {
+      // Match END_filename on its own line, at end, or with trailing whitespace
+      endDetect: new RegExp(`END_${escaped}\\s*$`, 'm'),
+      // Strip a trailing END marker accidentally captured as content
+      endTrailing: new RegExp(`\\s*END_${escaped}\\s*$`)
+    };
+    markerRegexCache.set(filename, entry);
+  }
+  return entry;
+}
+
 /**
  * Reads a file from a serial device using the READFILE command.
  * Buffers until END marker, handles timeouts and errors.
@@ -39,10 +66,22 @@ function readFile(port, filename, timeoutMs = DEFAULT_TIMEOUT) {
     // Add small delay to let firmware reset completely
     await new Promise(res => setTimeout(res, 50));
     
-    let buffer = '';
+    // Accumulate received chunks in an array and join once when the END
+    // marker arrives - repeated string concatenation re-copied the whole
+    // buffer on every chunk, which is quadratic in file size
+    const chunks = [];
+    let receivedLength = 0;
     let finished = false;
     let resolved = false;
     console.log(`[serialFileIO] readFile called for filename: ${filename}`);
+
+    // Markers and END detection regex are fixed for the whole read, so
+    // resolve them once up front instead of on every incoming chunk
+    const startMarker = `START_${filename}`;
+    const endMarker = `END_${filename}`;
+    const endMarkerRegex = getMarkerRegexes(filename).endDetect;
+    // Carry-over tail so a marker split across two chunks is still detected
+    let tailCarry = '';
     
     // Add special debugging for boot.py
     const isBootPy = filename === 'boot.py';
@@ -55,6 +94,7 @@ function readFile(port, filename, timeoutMs = DEFAULT_TIMEOUT) {
         finished = true;
         resolved = true;
         port.off('data', onData);
+        const buffer = chunks.join('');
         console.warn(`[serialFileIO] [TIMEOUT] Listener removed for ${filename}`);
         console.warn(`[serialFileIO] [TIMEOUT] Buffer dump for ${filename}:`, buffer);
         if (isBootPy) {
@@ -71,24 +111,33 @@ function readFile(port, filename, timeoutMs = DEFAULT_TIMEOUT) {
     function onData(data) {
       if (resolved) return;
       const str = data.toString();
-      buffer += str;
-      
-      // Enhanced debugging for boot.py
-      if (isBootPy) {
-        console.log(`[serialFileIO][BOOT.PY] Received ${str.length} chars, total buffer: ${buffer.length}`);
-        if (buffer.length % 5000 === 0) { // Log every 5KB
-          console.log(`[serialFileIO][BOOT.PY] Progress: ${buffer.length} characters received`);
+      chunks.push(str);
+      receivedLength += str.length;
+
+      if (SERIAL_DEBUG) {
+        // Enhanced debugging for boot.py
+        if (isBootPy) {
+          console.log(`[serialFileIO][BOOT.PY] Received ${str.length} chars, total buffer: ${receivedLength}`);
+          if (receivedLength % 5000 === 0) { // Log every 5KB
+            console.log(`[serialFileIO][BOOT.PY] Progress: ${receivedLength} characters received`);
+          }
         }
+
+        // Log the first 100 chars of the buffer for every chunk
+        const head = chunks[0];
+        const preview = head.length > 100 ? head.slice(0, 100) + '...' : head;
+        console.log(`[serialFileIO][DEBUG] Buffer preview for ${filename}:`, preview);
+        console.log(`[serialFileIO] Data received for ${filename}:`, str);
       }
-      
-      // Log the first 100 chars of the buffer for every chunk
-      const preview = buffer.length > 100 ? buffer.slice(0, 100) + '...' : buffer;
-      console.log(`[serialFileIO][DEBUG] Buffer preview for ${filename}:`, preview);
-      console.log(`[serialFileIO] Data received for ${filename}:`, str);
-      
-      // Robust END marker detection: match END_filename on its own line, at end, or with trailing whitespace
-      const endMarkerRegex = new RegExp(`END_${filename.replace('.', '\\.')}\\s*$`, 'm');
-      if (endMarkerRegex.test(buffer)) {
+
+      // Only scan the newly received data (plus a small carry-over from the
+      // previous chunk) for the END marker, instead of re-scanning the whole
+      // accumulated buffer on every chunk - large files arrive in many chunks
+      // and the full rescan made receive time quadratic in file size
+      const tailWindow = tailCarry + str;
+      tailCarry = tailWindow.slice(-(endMarker.length + 8));
+      if (endMarkerRegex.test(tailWindow)) {
+        const buffer = chunks.join('');
         if (isBootPy) {
           console.log(`[serialFileIO][BOOT.PY] END marker detected! Buffer length: ${buffer.length}`);
         }
@@ -97,9 +146,6 @@ function readFile(port, filename, timeoutMs = DEFAULT_TIMEOUT) {
         clearTimeout(timer);
         cleanupListeners();
         // Extract content between START_filename and END_filename markers with enhanced contamination filtering
-        const startMarker = `START_${filename}`;
-        const endMarker = `END_${filename}`;
-        
         let content = '';
         const lines = buffer.split(/\r?\n/);
         let capturing = false;
@@ -148,7 +194,9 @@ function readFile(port, filename, timeoutMs = DEFAULT_TIMEOUT) {
                 (trimmed.includes('"gamepad.py"') && trimmed.includes('FIRMWARE_FILES')) ||
                 (trimmed.includes('"serial_handler.py"') && trimmed.includes('FIRMWARE_FILES')) ||
                 (trimmed.includes('"pin_detect.py"') && trimmed.includes('FIRMWARE_FILES'))) {
-              console.log(`[serialFileIO][FILTER] Filtered contamination for ${filename}: ${trimmed}`);
+              if (SERIAL_DEBUG) {
+                console.log(`[serialFileIO][FILTER] Filtered contamination for ${filename}: ${trimmed}`);
+              }
               continue;
             }
             
@@ -175,7 +223,7 @@ function readFile(port, filename, timeoutMs = DEFAULT_TIMEOUT) {
         }
         
         // CRITICAL: Remove any trailing END marker that might have been included
-        const endMarkerPattern = new RegExp(`\\s*END_${filename.replace('.', '\\.')}\\s*$`);
+        const endMarkerPattern = getMarkerRegexes(filename).endTrailing;
         if (endMarkerPattern.test(content)) {
           content = content.replace(endMarkerPattern, '').trim();
           console.log(`[serialFileIO][CLEANUP] Removed trailing END marker from ${filename} content`);
@@ -196,7 +244,9 @@ function readFile(port, filename, timeoutMs = DEFAULT_TIMEOUT) {
         // Log the first 100 chars of the final content
         const contentPreview = content.length > 100 ? content.slice(0, 100) + '...' : content;
         console.log(`[serialFileIO][DEBUG] Final content preview for ${filename}:`, contentPreview);
-        console.log(`[serialFileIO] Final content for ${filename}:`, content);
+        if (SERIAL_DEBUG) {
+          console.log(`[serialFileIO] Final content for ${filename}:`, content);
+        }
         console.log(`[serialFileIO] Promise resolved for ${filename}`);
         resolve(content);
       }
@@ -259,7 +309,9 @@ function writeFile(port, filename, content, timeoutMs = null) {
     function onData(data) {
       const str = data.toString();
       allResponses.push(str.trim()); // Track all responses
-      console.log(`[serialFileIO] writeFile received data for ${filename}:`, JSON.stringify(str));
+      if (SERIAL_DEBUG) {
+        console.log(`[serialFileIO] writeFile received data for ${filename}:`, JSON.stringify(str));
+      }
       
       // DEBUG: Check for any device response
       if (str.includes('DEBUG:') || str.includes('Note:') || str.includes('Starting write')) {
@@ -287,7 +339,9 @@ function writeFile(port, filename, content, timeoutMs = null) {
         reject(new Error(`Error writing file: ${filename}. Error: ${str.trim()}`));
       } else if (str.includes('FIRMWARE_READY')) {
         console.log(`[serialFileIO] Received FIRMWARE_READY during ${filename} write - ignoring`);
-      } else {
+      } else if (SERIAL_DEBUG) {
+        // Echoed file content lands here during large writes - tracing it
+        // stringifies every chunk, so keep it behind the debug gate
         console.log(`[serialFileIO] Received unexpected response during ${filename} write:`, JSON.stringify(str));
       }
     }
@@ -338,27 +392,42 @@ function writeFile(port, filename, content, timeoutMs = null) {
         }
       }
     } else {
-      // Send content line by line with delays to prevent overwhelming the device
-      const lines = content.split('\n');
-      console.log(`[serialFileIO] Sending ${lines.length} lines for ${filename}`);
-      
-      for (let i = 0; i < lines.length; i++) {
-        const line = lines[i];
-        // Send line with newline (except for last line if content didn't end with newline)
-        if (i < lines.length - 1 || content.endsWith('\n')) {
-          port.write(line + '\n');
-        } else {
-          port.write(line);
+      // Send content in bursts of 10 lines with one serial write per burst -
+      // writing each line individually fragmented every line into its own
+      // USB packet and the framing overhead dominated transfer time.
+      // Bursts are sliced straight off the content string at newline
+      // boundaries rather than splitting the whole file into a per-line
+      // array first, so large files are not duplicated in memory.
+      console.log(`[serialFileIO] Sending ${contentLength} bytes for ${filename}`);
+      const LINES_PER_BATCH = 10;
+      let pos = 0;
+      let linesSent = 0;
+
+      while (pos < contentLength) {
+        // Advance over up to LINES_PER_BATCH newlines to find the burst end
+        let end = pos;
+        let linesInBatch = 0;
+        while (linesInBatch < LINES_PER_BATCH && end < contentLength) {
+          const nl = content.indexOf('\n', end);
+          if (nl === -1) {
+            end = contentLength;
+          } else {
+            end = nl + 1;
+          }
+          linesInBatch++;
         }
-        
-        // Add delay every 10 lines to give device time to process
-        if ((i + 1) % 10 === 0) {
+        port.write(content.slice(pos, end));
+        pos = end;
+        linesSent += linesInBatch;
+
+        // Keep the inter-batch delay to give device time to process
+        if (pos < contentLength) {
           // Enhanced delays: 75ms for large files (>10KB), 50ms for smaller files
           const delayMs = fileSizeKB > 10 ? 75 : 50;
           await new Promise(resolve => setTimeout(resolve, delayMs));
-          // Log progress for large files (50+ lines)
-          if (lines.length >= 50) {
-            console.log(`[serialFileIO] Sent ${i + 1}/${lines.length} lines for ${filename}`);
+          // Log progress for large files
+          if (linesSent % 50 === 0) {
+            console.log(`[serialFileIO] Sent ${linesSent} lines (${pos}/${contentLength} bytes) for ${filename}`);
           }
         }
       }